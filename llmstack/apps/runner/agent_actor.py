@@ -79,7 +79,7 @@ class AgentActor(OutputActor):
 
         delta = self._dmp.to_delta("", error_message)
 
-        self._content_queue.put_nowait(
+        self._queue_content(
             {
                 "deltas": {f"agent_tool_call_errors__{output_index}__{tool_name}__{tool_call_id}": delta},
                 "chunk": {f"{tool_name}/{output_index}/{tool_call_id}": errors},
@@ -119,7 +119,7 @@ class AgentActor(OutputActor):
                     )
                     delta = self._dmp.to_delta(old_agent_output, self._agent_outputs[f"agent_output__{message_index}"])
 
-                    self._content_queue.put_nowait(
+                    self._queue_content(
                         {
                             "deltas": {f"agent_output__{message_index}": delta},
                             "chunk": {"agent": {message_index: controller_output}},
@@ -145,7 +145,7 @@ class AgentActor(OutputActor):
                             ),
                         )
                     )
-                    self._content_queue.put_nowait(
+                    self._queue_content(
                         {
                             "output": {
                                 **self._agent_outputs,
@@ -180,7 +180,7 @@ class AgentActor(OutputActor):
                             f"agent_tool_calls__{message_index}__{stitched_tool_call.name}__{stitched_tool_call.id}"
                         ] = delta
 
-                    self._content_queue.put_nowait(
+                    self._queue_content(
                         {
                             "deltas": deltas,
                             "chunk": {"agent": {message_index: controller_output}},
@@ -216,7 +216,7 @@ class AgentActor(OutputActor):
                     self._errors = [Error(message=controller_output.data.content[0].data)]
                 elif controller_output.type == AgentControllerDataType.INPUT_STREAM:
                     # Input has started streaming. We need to let the client know so they can interrupt audio playback
-                    self._content_queue.put_nowait(
+                    self._queue_content(
                         {
                             "deltas": {"agent_input_audio_stream_started_at": self._dmp.to_delta("", str(time.time()))},
                         }
@@ -225,7 +225,7 @@ class AgentActor(OutputActor):
                     # Send output_stream info to the client
                     for content in controller_output.data.content:
                         if content.type == AgentMessageContentType.AUDIO_STREAM:
-                            self._content_queue.put_nowait(
+                            self._queue_content(
                                 {
                                     "deltas": {
                                         f"agent_output_audio_stream__{message_index}": self._dmp.to_delta(
@@ -235,7 +235,7 @@ class AgentActor(OutputActor):
                                 }
                             )
                         elif content.type == AgentMessageContentType.TRANSCRIPT_STREAM:
-                            self._content_queue.put_nowait(
+                            self._queue_content(
                                 {
                                     "deltas": {
                                         f"agent_output_transcript_stream__{message_index}": self._dmp.to_delta(
@@ -296,7 +296,7 @@ class AgentActor(OutputActor):
                                 type=AgentMessageContentType.TEXT_STREAM, data=message.data.content.get("text")
                             )
                         )
-                        self._content_queue.put_nowait(
+                        self._queue_content(
                             {
                                 "deltas": {
                                     "agent_input_text_stream": self._dmp.to_delta(
@@ -311,7 +311,7 @@ class AgentActor(OutputActor):
                                 type=AgentMessageContentType.AUDIO_STREAM, data=message.data.content.get("audio")
                             )
                         )
-                        self._content_queue.put_nowait(
+                        self._queue_content(
                             {
                                 "deltas": {
                                     "agent_input_audio_stream": self._dmp.to_delta(
@@ -327,7 +327,7 @@ class AgentActor(OutputActor):
                                 data=message.data.content.get("transcript"),
                             )
                         )
-                        self._content_queue.put_nowait(
+                        self._queue_content(
                             {
                                 "deltas": {
                                     "agent_input_transcript_stream": self._dmp.to_delta(
@@ -394,7 +394,7 @@ class AgentActor(OutputActor):
                     },
                 )
 
-                self._content_queue.put_nowait(
+                self._queue_content(
                     {
                         "deltas": {f"agent_tool_call_done__{output_index}__{tool_name}__{tool_call_id}": "True"},
                     }
@@ -439,7 +439,7 @@ class AgentActor(OutputActor):
 
                 delta = self._dmp.to_delta(prev_tool_call_output, tool_call_output)
 
-                self._content_queue.put_nowait(
+                self._queue_content(
                     {
                         "deltas": {f"agent_tool_call_output__{output_index}__{tool_name}__{tool_call_id}": delta},
                         "chunk": {message.sender: message.data.chunk},
@@ -1,19 +1,47 @@
 import asyncio
 import logging
+import time
 from typing import Any, Dict, List, NamedTuple, Set
 
+import orjson
 from pydantic import BaseModel
 
-from llmstack.common.utils.liquid import render_template
+from llmstack.common.utils.liquid import compile_template
 from llmstack.play.actor import Actor, BookKeepingData
 from llmstack.play.messages import Error, Message, MessageType
-from llmstack.play.output_stream import stitch_model_objects
-from llmstack.play.utils import DiffMatchPatch
+from llmstack.play.output_stream import stitch_model_objects, stitch_model_objects_at
+from llmstack.play.utils import DiffMatchPatch, extract_scalar_template_path
 
 logger = logging.getLogger(__name__)
 
 SENTINEL = object()
 
+# Upper bound on queued-but-unconsumed content entries; keeps a stalled
+# consumer from holding every delta of a long stream in memory
+CONTENT_QUEUE_MAX_SIZE = 256
+
+# DiffMatchPatch holds no state between calls, so all OutputActors can share
+# one instance
+_DMP = DiffMatchPatch()
+
+
+# Concrete BaseModel types seen on the CONTENT path; after the first
+# message of a given type, the O(1) identity probe replaces the MRO walk
+# that isinstance performs
+_BASEMODEL_TYPES: Set[type] = set()
+
+
+def _content_to_dict(content):
+    # orjson round-trips a serialized model faster than pydantic's
+    # Python-level dict builder for non-trivial models
+    content_type = type(content)
+    if content_type in _BASEMODEL_TYPES:
+        return orjson.loads(content.model_dump_json())
+    if isinstance(content, BaseModel):
+        _BASEMODEL_TYPES.add(content_type)
+        return orjson.loads(content.model_dump_json())
+    return content
+
 
 class OutputResponse(NamedTuple):
     """
@@ -34,6 +62,7 @@ class OutputActor(Actor):
         templates: Dict[str, str] = {},
         spread_output_for_keys: Set[str] = set(),
         bookkeeping_queue: asyncio.Queue = None,
+        coalesce_window_secs: float = 0.005,
     ):
         super().__init__(
             id="output",
@@ -42,9 +71,27 @@ class OutputActor(Actor):
             bookkeeping_queue=bookkeeping_queue,
         )
         self._templates = templates
+        try:
+            self._compiled_output_template = compile_template(templates["output"]) if "output" in templates else None
+        except Exception as e:
+            # A malformed user template should degrade the stream like it did
+            # when templates were parsed per chunk, not abort actor
+            # construction; _flush_stream_chunks retries under its callers'
+            # guards
+            logger.error(f"Error compiling output template: {e}")
+            self._compiled_output_template = None
+        self._output_template_path = (
+            extract_scalar_template_path(templates["output"]) if "output" in templates else None
+        )
+        self._coalesce_window_secs = coalesce_window_secs
+        # Dependencies are immutable; build the set once instead of on every
+        # CONTENT message
+        self._dependency_set = frozenset(dependencies)
         self.reset()
-        self._dmp = DiffMatchPatch()
-        self._spread_output_for_keys = spread_output_for_keys
+        # Alias to the shared instance; subclasses like AgentActor compute
+        # deltas through self._dmp
+        self._dmp = _DMP
+        self._spread_output_for_keys = frozenset(spread_output_for_keys)
 
     def on_receive(self, message: Message) -> Any:
         if message.type == MessageType.ERRORS:
@@ -53,55 +100,160 @@ class OutputActor(Actor):
 
         if message.type == MessageType.CONTENT_STREAM_CHUNK:
             try:
-                self._stitched_data = stitch_model_objects(
-                    self._stitched_data,
-                    (
-                        {message.sender: message.data.chunk}
-                        if message.sender not in self._spread_output_for_keys
-                        else message.data.chunk
-                    ),
-                )
-                new_int_output = render_template(self._templates["output"], self._stitched_data)
-                delta = self._dmp.to_delta(self._int_output.get("output", ""), new_int_output)
-                self._int_output["output"] = new_int_output
-
-                self._output_stream.bookkeep(BookKeepingData(output=self._int_output))
+                if message.sender in self._spread_output_for_keys:
+                    self._stitched_data = stitch_model_objects(self._stitched_data, message.data.chunk)
+                else:
+                    stitch_model_objects_at(self._stitched_data, message.sender, message.data.chunk)
+                stitch_model_objects_at(self._pending_chunks, message.sender, message.data.chunk)
 
-                self._content_queue.put_nowait(
-                    {
-                        "deltas": {"output": delta},
-                        "chunk": {message.sender: message.data.chunk},
-                    }
-                )
+                # Tokens often arrive faster than consumers can use them;
+                # coalesce chunks within a small window and render/diff once
+                # per window instead of once per token.
+                if time.monotonic() - self._last_flush_at >= self._coalesce_window_secs:
+                    self._flush_stream_chunks()
             except Exception as e:
                 logger.error(f"Error processing content stream chunk: {e}")
 
+        if message.type == MessageType.CONTENT_STREAM_END:
+            try:
+                self._flush_stream_chunks()
+            except Exception as e:
+                logger.error(f"Error flushing content stream chunks: {e}")
+
         if message.type == MessageType.CONTENT:
-            self._messages[message.sender] = (
-                message.data.content.model_dump()
-                if isinstance(message.data.content, BaseModel)
-                else message.data.content
-            )
-
-            if set(self._dependencies) == set(self._messages.keys()):
-                self._content_queue.put_nowait(
+            self._messages[message.sender] = _content_to_dict(message.data.content)
+
+            if len(self._messages) == len(self._dependency_set) and self._messages.keys() >= self._dependency_set:
+                try:
+                    self._flush_stream_chunks(force=True)
+                except Exception as e:
+                    logger.error(f"Error flushing content stream chunks: {e}")
+                self._queue_content(
                     {
                         "output": self._int_output,
                         "chunks": self._messages,
                     }
                 )
 
+    def _run_in_consumer_loop(self, callback, *args) -> None:
+        """
+        Runs callback on the loop consuming get_output. The content queue and
+        the stop/error events are plain asyncio primitives and are not
+        thread-safe, while producers run on pykka actor threads (and, for
+        agents, a separate output loop); waking waiters from a foreign thread
+        neither signals the loop nor is race-free, so hand the call over with
+        call_soon_threadsafe. Falls back to a direct call before a consumer
+        loop exists, when there are no waiters to wake.
+        """
+        loop = self._consumer_loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is not loop:
+                loop.call_soon_threadsafe(callback, *args)
+                return
+        callback(*args)
+
+    def _queue_put(self, item) -> None:
+        try:
+            self._content_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Evict the oldest entry rather than the new one so terminal
+            # items (final output, agent end markers) are never lost behind
+            # a stalled consumer
+            logger.warning("Content queue full; evicting oldest entry")
+            self._content_queue.get_nowait()
+            self._content_queue.task_done()
+            self._content_queue.put_nowait(item)
+
+    def _queue_content(self, item) -> None:
+        self._run_in_consumer_loop(self._queue_put, item)
+
+    def _flush_stream_chunks(self, force: bool = False) -> None:
+        if not self._pending_chunks:
+            return
+
+        if self._content_queue.full() and not force:
+            # The consumer has stalled; defer the flush so pending chunks
+            # keep coalescing and the next successful flush emits a single
+            # delta covering all of them. Terminal flushes pass force=True
+            # so _int_output is up to date before the final payload.
+            return
+
+        old_output = self._int_output.get("output", "")
+        new_int_output = None
+        delta = None
+
+        if self._output_template_path is not None:
+            # Pure `{{ key }}` templates render to the referenced value
+            # itself, so chunks that extend it can be turned into a delta
+            # directly without re-rendering or diffing.
+            leaf = self._resolve_output_path()
+            if isinstance(leaf, str) and leaf.startswith(old_output):
+                appended = leaf[len(old_output) :]
+                delta = _DMP.to_append_delta(self._output_utf16_len, appended)
+                self._output_utf16_len += DiffMatchPatch.utf16_len(appended)
+                new_int_output = leaf
+
+        if delta is None:
+            if self._compiled_output_template is None:
+                # Compilation failed at construction; retrying here surfaces
+                # the error through the callers' try/except on every flush,
+                # matching the old per-chunk render behavior
+                self._compiled_output_template = compile_template(self._templates["output"])
+            new_int_output = self._compiled_output_template.render(**self._stitched_data)
+            delta = _DMP.to_delta(old_output, new_int_output)
+            self._output_utf16_len = DiffMatchPatch.utf16_len(new_int_output)
+
+        self._int_output["output"] = new_int_output
+
+        self._output_stream.bookkeep(BookKeepingData(output=self._int_output))
+
+        self._queue_content(
+            {
+                "deltas": {"output": delta},
+                "chunk": self._pending_chunks,
+            }
+        )
+        self._pending_chunks = {}
+        self._last_flush_at = time.monotonic()
+
+    def _resolve_output_path(self):
+        value = self._stitched_data
+        for key in self._output_template_path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return value
+
     async def get_output(self):
+        # Capture the loop so producers on other threads can hand items and
+        # stop/error signals over to it
+        self._consumer_loop = asyncio.get_running_loop()
         try:
-            while True:
-                if not self._content_queue.empty():
-                    output = self._content_queue.get_nowait()
-                    yield output
+            while not (self._errors or self._stopped):
+                get_task = asyncio.ensure_future(self._content_queue.get())
+                stopped_task = asyncio.ensure_future(self._stopped_event.wait())
+                errored_task = asyncio.ensure_future(self._errored_event.wait())
+
+                done, pending = await asyncio.wait(
+                    {get_task, stopped_task, errored_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in pending:
+                    task.cancel()
+
+                if get_task in done:
+                    yield get_task.result()
                     self._content_queue.task_done()
-                else:
-                    if self._errors or self._stopped:
-                        break
-                    await asyncio.sleep(0.01)
+
+            # Drain any content that was queued before we stopped or errored
+            while not self._content_queue.empty():
+                yield self._content_queue.get_nowait()
+                self._content_queue.task_done()
 
         except asyncio.CancelledError:
             logger.info("Output stream cancelled")
@@ -112,19 +264,31 @@ class OutputActor(Actor):
                 yield {"errors": ["Output interrupted"]}
 
     def on_stop(self) -> None:
+        try:
+            self._flush_stream_chunks(force=True)
+        except Exception as e:
+            logger.error(f"Error flushing content stream chunks: {e}")
         self._stopped = True
+        self._run_in_consumer_loop(self._stopped_event.set)
         return super().on_stop()
 
     def on_error(self, sender, errors: List[Error]) -> None:
         logger.error(f"Error in output actor: {errors}")
         self._errors = errors
+        self._run_in_consumer_loop(self._errored_event.set)
 
     def reset(self) -> None:
         self._stitched_data = {}
         self._int_output = {}
+        self._output_utf16_len = 0
+        self._pending_chunks = {}
+        self._last_flush_at = 0.0
         self._errors = None
         self._stopped = False
-        self._content_queue = asyncio.Queue()
+        self._stopped_event = asyncio.Event()
+        self._errored_event = asyncio.Event()
+        self._consumer_loop = None
+        self._content_queue = asyncio.Queue(maxsize=CONTENT_QUEUE_MAX_SIZE)
         self._messages = {}
         super().reset()
 
@@ -1,6 +1,7 @@
 import ast
 import json
 import logging
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 import lxml.etree as ET
@@ -110,8 +111,14 @@ env.add_filter("xpath", xpath_filter)
 env.add_filter("html_xpath", html_xpath_filter)
 
 
+@lru_cache(maxsize=None)
+def compile_template(template):
+    """Parse a template string once and cache the compiled template."""
+    return env.from_string(template)
+
+
 def render_template(template, data):
-    return env.from_string(template).render(**data)
+    return compile_template(template).render(**data)
 
 
 def hydrate_input(input, values):
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from llmstack.common.blocks.base.schema import StrEnum
 
@@ -37,7 +37,7 @@ class ContentStreamChunkData(MessageData):
 
 
 class Message(BaseModel):
-    id: str = str(uuid.uuid4())
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     type: MessageType
     sender: str
     receiver: Optional[str] = None
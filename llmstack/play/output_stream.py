@@ -92,6 +92,22 @@ def stitch_model_objects(obj1: Any, obj2: Any) -> Any:
         return obj2 if obj2 else obj1
 
 
+def stitch_model_objects_at(obj: Dict[str, Any], key: Any, chunk: Any) -> None:
+    """Stitch chunk into obj[key] in place.
+
+    Equivalent to ``stitch_model_objects(obj, {key: chunk})`` for a dict
+    root, without allocating a temporary one-entry dict or rebuilding the
+    root dict — the common case on the streaming path.
+    """
+    existing = obj.get(key)
+    if existing is None:
+        obj[key] = chunk
+    elif isinstance(existing, str) and isinstance(chunk, str):
+        obj[key] = existing + chunk
+    else:
+        obj[key] = stitch_model_objects(existing, chunk)
+
+
 class OutputStream:
     """
     OutputStream class.
@@ -135,13 +151,15 @@ class OutputStream:
         Stitches fields from data to _data.
         """
 
+        # These messages are built and relayed per streamed chunk between
+        # trusted in-process actors, so skip pydantic validation.
         self._coordinator.relay(
-            Message(
+            Message.model_construct(
                 id=self._message_id,
                 type=MessageType.CONTENT_STREAM_CHUNK,
                 sender=self._stream_id,
                 receiver="coordinator",
-                data=ContentStreamChunkData(
+                data=ContentStreamChunkData.model_construct(
                     chunk=(
                         data.model_dump()
                         if isinstance(
@@ -196,7 +214,7 @@ class OutputStream:
 
         # Send the end message
         self._coordinator.relay(
-            Message(
+            Message.model_construct(
                 id=self._message_id,
                 type=MessageType.CONTENT_STREAM_END,
                 sender=self._stream_id,
@@ -207,12 +225,12 @@ class OutputStream:
         # Send the final data
 
         self._coordinator.relay(
-            Message(
+            Message.model_construct(
                 id=self._message_id,
                 type=MessageType.CONTENT,
                 sender=self._stream_id,
                 receiver="coordinator",
-                data=ContentData(
+                data=ContentData.model_construct(
                     content=(
                         output.model_dump()
                         if isinstance(
@@ -7,6 +7,7 @@ from urllib.parse import quote
 
 from diff_match_patch import diff_match_patch
 from liquid.ast import ChildNode, ParseTree
+from liquid.builtin.statement import StatementNode
 from liquid.expression import (
     AssignmentExpression,
     Blank,
@@ -137,6 +138,36 @@ class ResettableTimer(threading.Thread):
             self.condition.notify_all()
 
 
+def extract_scalar_template_path(liquid_template):
+    """
+    Returns the identifier path (e.g. ["processor1", "output"]) if the template
+    is a single `{{ key }}` output statement with no filters, else None.
+    Templates of this shape render to the referenced value itself, which lets
+    callers skip the render entirely.
+    """
+    try:
+        template = liquid_env.from_string(liquid_template)
+        statements = template.tree.statements
+        if len(statements) != 1 or not isinstance(statements[0], StatementNode):
+            return None
+
+        expression = statements[0].expression
+        if not isinstance(expression, FilteredExpression) or expression.filters:
+            return None
+        if not isinstance(expression.expression, Identifier):
+            return None
+
+        path = []
+        for element in expression.expression.path:
+            if isinstance(element, Identifier):
+                # Dynamic segments like a[b] depend on other variables
+                return None
+            path.append(element.value)
+        return path
+    except Exception:
+        return None
+
+
 def extract_variables_from_liquid_template(liquid_template):
     variables = []
 
@@ -205,11 +236,57 @@ class DiffMatchPatch:
                 data = data.encode("utf-8")
                 text.append("+" + quote(data, "!~*'();/?:@&=+$,# "))
             elif op == self._diff_match_patch.DIFF_DELETE:
-                text.append("-%d" % (len(data.encode("utf-16-be")) // 2))
+                text.append("-%d" % self.utf16_len(data))
             elif op == self._diff_match_patch.DIFF_EQUAL:
-                text.append("=%d" % (len(data.encode("utf-16-be")) // 2))
+                text.append("=%d" % self.utf16_len(data))
         return "\t".join(text)
 
+    @staticmethod
+    def utf16_len(text):
+        """Length of text in utf-16 code units, the unit used by delta ops."""
+        # ASCII (the common case for streamed output) needs no encode; the
+        # isascii probe is a C-level scan with no allocation.
+        if text.isascii():
+            return len(text)
+        return len(text.encode("utf-16-be")) // 2
+
+    def to_append_delta(self, equal_length, text):
+        """
+        Delta that keeps ``equal_length`` utf-16 code units and appends
+        ``text``, built without diffing.
+        """
+        ops = []
+        if equal_length:
+            ops.append("=%d" % equal_length)
+        if text:
+            ops.append("+" + quote(text.encode("utf-8"), "!~*'();/?:@&=+$,# "))
+        return "\t".join(ops)
+
     def to_delta(self, text1, text2):
-        diffs = self._diff_match_patch.diff_main(text1, text2)
+        dmp = self._diff_match_patch
+
+        # Streaming chunks virtually always append to the previous text, so
+        # emit the delta directly instead of diffing the whole document.
+        if text2.startswith(text1):
+            diffs = [(dmp.DIFF_EQUAL, text1)] if text1 else []
+            if len(text2) > len(text1):
+                diffs.append((dmp.DIFF_INSERT, text2[len(text1) :]))
+            return self.diff_toDelta(diffs)
+
+        # Otherwise strip the common prefix and suffix so the quadratic diff
+        # only sees the region of the texts that actually changed.
+        prefix_length = dmp.diff_commonPrefix(text1, text2)
+        prefix = text1[:prefix_length]
+        text1, text2 = text1[prefix_length:], text2[prefix_length:]
+
+        suffix_length = dmp.diff_commonSuffix(text1, text2)
+        suffix = text1[len(text1) - suffix_length :] if suffix_length else ""
+        if suffix_length:
+            text1, text2 = text1[:-suffix_length], text2[:-suffix_length]
+
+        diffs = dmp.diff_main(text1, text2)
+        if prefix:
+            diffs.insert(0, (dmp.DIFF_EQUAL, prefix))
+        if suffix:
+            diffs.append((dmp.DIFF_EQUAL, suffix))
         return self.diff_toDelta(diffs)
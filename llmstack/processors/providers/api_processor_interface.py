@@ -1,9 +1,12 @@
+import inspect
 import logging
 import time
+import uuid
 from functools import cache
 from typing import Any, Dict, Optional
 
 import ujson as json
+from asgiref.sync import async_to_sync
 from django import db
 from django.shortcuts import get_object_or_404
 from pydantic import BaseModel
@@ -121,6 +124,37 @@ class ApiProcessorInterface(
 
         return asset
 
+    # Upload raw bytes to the session, skipping the data-URI encode/decode
+    # round-trip
+    def _upload_asset_from_bytes(self, file_bytes, file_name=None, mime_type=None):
+        from llmstack.apps.models import AppSessionFiles
+
+        file_name = file_name or uuid.uuid4().hex
+        try:
+            asset_metadata = {
+                "app_uuid": self._app_uuid,
+                "username": self._request_user.email,
+                "file_name": file_name,
+            }
+
+            if mime_type:
+                asset_metadata["mime_type"] = mime_type
+
+            asset = AppSessionFiles.create_from_bytes(
+                file_bytes,
+                file_name,
+                metadata=asset_metadata,
+                ref_id=self._session_id,
+            )
+        except Exception as e:
+            logger.exception(e)
+            db.connection.close()
+            return None
+
+        db.connection.close()
+
+        return asset
+
     def _create_asset_stream(self, mime_type, file_name=None):
         """
         Creates an asset stream that can processor can append binary data to. Once the stream is closed, the asset
@@ -350,7 +384,13 @@ class ApiProcessorInterface(
                     if self._config and message
                     else self._config_template
                 )
-            output = self.process()
+            # Processors can implement process as a coroutine to await
+            # output_stream.write natively instead of paying the
+            # async_to_sync bridge overhead on every write
+            if inspect.iscoroutinefunction(self.process):
+                output = async_to_sync(self.process)()
+            else:
+                output = self.process()
         except Exception as e:
             logger.exception("Error processing input")
             output = {
@@ -1,11 +1,14 @@
+import asyncio
+import atexit
 import logging
+import time
 from typing import Any, Dict, Optional
 
-from asgiref.sync import async_to_sync
+import httpx
+import orjson
 from pydantic import Field
 
 from llmstack.apps.schemas import OutputTemplate
-from llmstack.common.utils.prequests import get
 from llmstack.processors.providers.api_processor_interface import (
     ApiProcessorInterface,
     ApiProcessorSchema,
@@ -14,6 +17,19 @@ from llmstack.processors.providers.metrics import MetricType
 
 logger = logging.getLogger(__name__)
 
+# Shared pooled client so concurrent checks reuse connections instead of
+# paying a TCP/TLS handshake per call. A sync Client is deliberate: process()
+# runs under async_to_sync, which builds a fresh event loop per call, and an
+# AsyncClient is bound to the loop it first ran on. The sync client is
+# thread-safe and loop-independent; requests go through asyncio.to_thread so
+# the caller's loop is not blocked.
+_http_client = httpx.Client(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    headers={"User-Agent": "Promptly"},
+)
+atexit.register(_http_client.close)
+
 
 class CheckProcessorInput(ApiProcessorSchema):
     email: Optional[str] = Field(description="The email to verify", default=None)
@@ -66,15 +82,19 @@ class EchoProcessor(
             jsonpath="$.response",
         )
 
-    def process(self) -> dict:
+    async def process(self) -> dict:
         provider_config = self.get_provider_config(provider_slug=self.provider_slug(), processor_slug="*")
-        deployment_config = self.get_provider_config(provider_slug=self.provider_slug(), processor_slug="*")
-        api_key = deployment_config.api_key
-        response = get(
+        api_key = provider_config.api_key
+        request_started_at = time.perf_counter()
+        response = await asyncio.to_thread(
+            _http_client.get,
             url="https://api.bounceban.com/v1/check",
             headers={"Authorization": f"{api_key}"},
-            params=self._input.model_dump(),
+            # httpx serializes None params as empty strings instead of
+            # omitting them; keep unset fields off the query string
+            params=self._input.model_dump(exclude_none=True),
         )
+        request_elapsed = time.perf_counter() - request_started_at
         self._usage_data.append(
             (
                 f"{self.provider_slug()}/*/*/*",
@@ -82,14 +102,34 @@ class EchoProcessor(
                 (provider_config.provider_config_source, 1),
             )
         )
-        async_to_sync(self._output_stream.write)(
+
+        # Decode the body once instead of going through response.text,
+        # response.json() and response.content separately, and only parse
+        # JSON when the response says it is JSON
+        raw_response = response.content
+        response_json = {}
+        if "application/json" in response.headers.get("content-type", ""):
+            try:
+                response_json = orjson.loads(raw_response)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Forward only the headers downstream consumers use instead of
+        # copying all of them
+        response_headers = {
+            key: response.headers[key]
+            for key in ("content-type", "content-length", "x-ratelimit-remaining", "x-request-id")
+            if key in response.headers
+        }
+
+        await self._output_stream.write(
             CheckProcessorOutput(
-                response=response.text,
-                response_json=response.json(),
-                headers=response.headers,
+                response=raw_response.decode(response.encoding or "utf-8", errors="replace"),
+                response_json=response_json,
+                headers=response_headers,
                 code=response.status_code,
-                size=len(response.content),
-                time=response.elapsed.total_seconds(),
+                size=len(raw_response),
+                time=request_elapsed,
             )
         )
 
@@ -1,6 +1,5 @@
 import logging
 
-from asgiref.sync import async_to_sync
 from pydantic import Field
 
 from llmstack.apps.schemas import OutputTemplate
@@ -57,15 +56,15 @@ class EchoProcessor(
             jsonpath="$.output_str",
         )
 
-    def process(self) -> dict:
+    async def process(self) -> dict:
         output_stream = self._output_stream
         if self._input.stream:
             for chunk in self._input.input_str.split(" "):
-                async_to_sync(output_stream.write)(
+                await output_stream.write(
                     EchoProcessorOutput(output_str=f"{chunk} "),
                 )
         else:
-            async_to_sync(output_stream.write)(
+            await output_stream.write(
                 EchoProcessorOutput(output_str=self._input.input_str),
             )
 
@@ -1,9 +1,8 @@
-import base64
+import asyncio
 import logging
 import uuid
 from typing import List, Optional
 
-from asgiref.sync import async_to_sync
 from django.conf import settings
 from langrocks.client import WebBrowser
 from langrocks.common.models.files import File
@@ -39,6 +38,21 @@ class BrowserInstructionType(StrEnum):
     KEY = "Key"
 
 
+INSTRUCTION_TYPE_TO_COMMAND_TYPE = {
+    BrowserInstructionType.GOTO: WebBrowserCommandType.GOTO,
+    BrowserInstructionType.CLICK: WebBrowserCommandType.CLICK,
+    BrowserInstructionType.WAIT: WebBrowserCommandType.WAIT,
+    BrowserInstructionType.COPY: WebBrowserCommandType.COPY,
+    BrowserInstructionType.SCROLLX: WebBrowserCommandType.SCROLL_X,
+    BrowserInstructionType.SCROLLY: WebBrowserCommandType.SCROLL_Y,
+    BrowserInstructionType.TERMINATE: WebBrowserCommandType.TERMINATE,
+    BrowserInstructionType.ENTER: WebBrowserCommandType.ENTER,
+    BrowserInstructionType.TYPE: WebBrowserCommandType.TYPE,
+    BrowserInstructionType.MOUSE_MOVE: WebBrowserCommandType.MOUSE_MOVE,
+    BrowserInstructionType.KEY: WebBrowserCommandType.KEY,
+}
+
+
 class BrowserInstruction(BaseModel):
     type: BrowserInstructionType
     selector: Optional[str] = None
@@ -196,36 +210,30 @@ class StaticWebBrowser(
         )
 
     def _web_browser_instruction_to_command(self, instruction: BrowserInstruction) -> WebBrowserCommand:
-        instruction_type = instruction.type
-        if instruction.type == BrowserInstructionType.GOTO.value:
-            instruction_type = WebBrowserCommandType.GOTO
-        elif instruction.type == BrowserInstructionType.CLICK.value:
-            instruction_type = WebBrowserCommandType.CLICK
-        elif instruction.type == BrowserInstructionType.WAIT.value:
-            instruction_type = WebBrowserCommandType.WAIT
-        elif instruction.type == BrowserInstructionType.COPY.value:
-            instruction_type = WebBrowserCommandType.COPY
-        elif instruction.type == BrowserInstructionType.SCROLLX.value:
-            instruction_type = WebBrowserCommandType.SCROLL_X
-        elif instruction.type == BrowserInstructionType.SCROLLY.value:
-            instruction_type = WebBrowserCommandType.SCROLL_Y
-        elif instruction.type == BrowserInstructionType.TERMINATE.value:
-            instruction_type = WebBrowserCommandType.TERMINATE
-        elif instruction.type == BrowserInstructionType.ENTER.value:
-            instruction_type = WebBrowserCommandType.ENTER
-        elif instruction.type == BrowserInstructionType.TYPE.value:
-            instruction_type = WebBrowserCommandType.TYPE
-        elif instruction.type == BrowserInstructionType.MOUSE_MOVE.value:
-            instruction_type = WebBrowserCommandType.MOUSE_MOVE
-        elif instruction.type == BrowserInstructionType.KEY.value:
-            instruction_type = WebBrowserCommandType.KEY
+        instruction_type = INSTRUCTION_TYPE_TO_COMMAND_TYPE.get(instruction.type, instruction.type)
 
         return WebBrowserCommand(
             command_type=instruction_type, data=(instruction.data or ""), selector=(instruction.selector or "")
         )
 
-    def process(self) -> dict:
-        output_stream = self._output_stream
+    def _get_storage_state(self):
+        # Resolve the connection's storage state once per connection instead
+        # of walking the connections dict on every invocation
+        connection_id = self._config.connection_id
+        if not connection_id:
+            return ""
+
+        if getattr(self, "_storage_state_connection_id", None) != connection_id:
+            self._storage_state = self._env["connections"][connection_id]["configuration"]["_storage_state"]
+            self._storage_state_connection_id = connection_id
+
+        return self._storage_state
+
+    def _run_browser_session(self, loop):
+        """
+        Runs the blocking WebBrowser session. Called from a worker thread so
+        the event loop stays free while langrocks executes the commands.
+        """
         browser_response = None
         session_videos = []
         updated_session_data = None
@@ -236,24 +244,21 @@ class StaticWebBrowser(
             capture_screenshot=self._config.capture_screenshot,
             html=self._config.extract_html,
             tags_to_extract=self._config.tags_to_extract,
-            session_data=(
-                self._env["connections"][self._config.connection_id]["configuration"]["_storage_state"]
-                if self._config.connection_id
-                else ""
-            ),
+            session_data=self._get_storage_state(),
             record_video=self._config.capture_session_video,
             persist_session=bool(self._config.connection_id),
         ) as web_browser:
             if self._config.stream_video and web_browser.get_wss_url():
-                async_to_sync(
-                    output_stream.write,
-                )(
-                    StaticWebBrowserOutput(
-                        session=BrowserRemoteSessionData(
-                            ws_url=web_browser.get_wss_url(),
+                asyncio.run_coroutine_threadsafe(
+                    self._output_stream.write(
+                        StaticWebBrowserOutput.model_construct(
+                            session=BrowserRemoteSessionData.model_construct(
+                                ws_url=web_browser.get_wss_url(),
+                            ),
                         ),
                     ),
-                )
+                    loop,
+                ).result()
 
             browser_response = web_browser.run_commands(
                 [
@@ -271,33 +276,78 @@ class StaticWebBrowser(
             if self._config.connection_id:
                 updated_session_data = web_browser.terminate()
 
+        return browser_response, session_videos, updated_session_data
+
+    async def process(self) -> dict:
+        output_stream = self._output_stream
+
+        browser_response, session_videos, updated_session_data = await asyncio.to_thread(
+            self._run_browser_session,
+            asyncio.get_running_loop(),
+        )
+
+        downloads = (browser_response.downloads if browser_response else None) or []
+
+        # Each upload is an independent I/O round-trip; run them concurrently
+        # instead of one after the other.
+        async def _upload_session_assets():
+            tasks = []
+            if browser_response and browser_response.screenshot:
+                tasks.append(
+                    asyncio.to_thread(
+                        self._upload_asset_from_bytes,
+                        browser_response.screenshot,
+                        file_name=f"{uuid.uuid4().hex}.png",
+                        mime_type="image/png",
+                    )
+                )
+            for download in downloads:
+                tasks.append(
+                    asyncio.to_thread(
+                        self._upload_asset_from_bytes,
+                        download.file.data,
+                        file_name=download.file.name,
+                        mime_type=download.file.mime_type,
+                    )
+                )
+            for video in session_videos:
+                tasks.append(
+                    asyncio.to_thread(
+                        self._upload_asset_from_bytes,
+                        video.data,
+                        file_name=video.name,
+                        mime_type=video.mime_type,
+                    )
+                )
+            return await asyncio.gather(*tasks)
+
+        uploaded_assets = iter(await _upload_session_assets())
+        screenshot_asset = next(uploaded_assets) if browser_response and browser_response.screenshot else None
+        download_assets = [next(uploaded_assets) for _ in downloads]
+        video_assets = [next(uploaded_assets) for _ in session_videos]
+
         if browser_response:
             output_text = browser_response.text or "\n".join(
                 list(map(lambda entry: entry.output, browser_response.command_outputs))
             )
-            browser_content = StaticWebBrowserContent.model_validate(
-                browser_response.model_dump(exclude=("screenshot", "downloads"))
+            # The browser response is an already-validated model; rebuild it
+            # as StaticWebBrowserContent without the dump + validate
+            # round-trip
+            browser_content = StaticWebBrowserContent.model_construct(
+                **{
+                    key: value
+                    for key, value in browser_response.__dict__.items()
+                    if key not in ("screenshot", "downloads")
+                }
             )
-            screenshot_asset = None
-            if browser_response.screenshot:
-                screenshot_asset = self._upload_asset_from_url(
-                    f"data:image/png;name={str(uuid.uuid4())};base64,{base64.b64encode(browser_response.screenshot).decode('utf-8')}",
-                    mime_type="image/png",
-                )
             browser_content.screenshot = screenshot_asset.objref if screenshot_asset else None
 
-            if browser_response.downloads:
+            if downloads:
                 swb_downloads = []
-                for download in browser_response.downloads:
-                    # Create an objref for the file data
-                    file_data = self._upload_asset_from_url(
-                        f"data:{download.file.mime_type};name={download.file.name};base64,{base64.b64encode(download.file.data).decode('utf-8')}",
-                        mime_type=download.file.mime_type,
-                    )
-
-                    swb_download = StaticWebBrowserDownload(
+                for download, file_data in zip(downloads, download_assets):
+                    swb_download = StaticWebBrowserDownload.model_construct(
                         url=download.url,
-                        file=StaticWebBrowserFile(
+                        file=StaticWebBrowserFile.model_construct(
                             name=download.file.name,
                             data=file_data.objref,
                             mime_type=download.file.mime_type,
@@ -305,34 +355,37 @@ class StaticWebBrowser(
                     )
                     swb_downloads.append(swb_download)
                 browser_content.downloads = swb_downloads
-            async_to_sync(self._output_stream.write)(StaticWebBrowserOutput(text=output_text, content=browser_content))
+            await self._output_stream.write(
+                StaticWebBrowserOutput.model_construct(text=output_text, content=browser_content)
+            )
 
         if session_videos:
             encoded_videos = []
-            for video in session_videos:
+            for video, video_asset in zip(session_videos, video_assets):
                 encoded_videos.append(
-                    StaticWebBrowserFile(
+                    StaticWebBrowserFile.model_construct(
                         name=video.name,
-                        data=self._upload_asset_from_url(
-                            f"data:{video.mime_type};name={video.name};base64,{base64.b64encode(video.data).decode('utf-8')}",
-                            mime_type=video.mime_type,
-                        ).objref,
+                        data=video_asset.objref,
                         mime_type=video.mime_type,
                     )
                 )
-            async_to_sync(self._output_stream.write)(StaticWebBrowserOutput(videos=encoded_videos))
+            await self._output_stream.write(StaticWebBrowserOutput.model_construct(videos=encoded_videos))
 
         output = output_stream.finalize()
 
         if self._config.connection_id and updated_session_data:
+            connection = self._env["connections"][self._config.connection_id]
             self.update_connection(
                 {
-                    **self._env["connections"][self._config.connection_id],
+                    **connection,
                     "configuration": {
-                        **self._env["connections"][self._config.connection_id]["configuration"],
+                        **connection["configuration"],
                         "_storage_state": updated_session_data,
                     },
                 }
             )
+            # Keep the cached storage state in sync with the write-back
+            self._storage_state = updated_session_data
+            self._storage_state_connection_id = self._config.connection_id
 
         return output